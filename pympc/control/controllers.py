@@ -1,7 +1,10 @@
 # external imports
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 from scipy.linalg import block_diag
+from scipy.spatial import ConvexHull
 
 # internal inputs
 from pympc.dynamics.discrete_time_systems import AffineSystem, PieceWiseAffineSystem
@@ -52,6 +55,11 @@ class ModelPredictiveController(object):
         # initilize explicit solution
         self.explicit_solution = None
 
+        # feasible set and grids of the optimal value function already evaluated for plotting
+        self._feasible_set = None
+        self._value_function_grids = {}
+        self._value_function_grids_solution = None
+
         # condense mpqp
         self.mpqp = self._condense_program()
 
@@ -134,6 +142,9 @@ class ModelPredictiveController(object):
         """
 
         self.explicit_solution = self.mpqp.explicit_solve(**kwargs)
+        self._feasible_set = None
+        self._value_function_grids = {}
+        self._value_function_grids_solution = None
 
     def feedforward_explicit(self, x):
         """
@@ -201,12 +212,29 @@ class ModelPredictiveController(object):
         if self.explicit_solution is None:
             raise ValueError('explicit solution not stored.')
 
-        # plot every critical region with random colors
+        # vertices of every critical region in counterclockwise order
+        polygons = []
         for cr in self.explicit_solution.critical_regions:
-            cr.polyhedron.plot(facecolor=np.random.rand(3), **kwargs)
-
-            # if required print active sets
-            if print_active_set:
+            if cr.polyhedron.vertices is None:
+                print('Cannot plot unbounded or empty polyhedra.')
+                continue
+            vertices = np.vstack(cr.polyhedron.vertices)[:, [0, 1]]
+            hull = ConvexHull(vertices)
+            polygons.append(vertices[hull.vertices])
+
+        # plot all the critical regions at once with random colors (black edges as in Polyhedron.plot)
+        if not any(k in kwargs for k in ('edgecolor', 'edgecolors', 'ec')):
+            kwargs['edgecolor'] = 'k'
+        ax = plt.gca()
+        colors = np.random.rand(len(polygons), 3)
+        ax.add_collection(PolyCollection(polygons, facecolors=colors, **kwargs))
+        ax.autoscale_view()
+        plt.xlabel(r'$x_1$')
+        plt.ylabel(r'$x_2$')
+
+        # if required print active sets
+        if print_active_set:
+            for cr in self.explicit_solution.critical_regions:
                 plt.text(cr.polyhedron.center[0], cr.polyhedron.center[1], str(cr.active_set))
 
     def plot_optimal_value_function(self, resolution=100, **kwargs):
@@ -215,8 +243,9 @@ class ModelPredictiveController(object):
 
         Arguments
         ----------
-        resolution : float
-            Size of the grid for the contour plot.
+        resolution : int
+            Number of grid points along the longest side of the box containing the feasible set.
+            The number of points along the other side is proportional to the aspect ratio of the box, but never less than resolution // 4.
         """
 
         # check dimension of the state
@@ -225,27 +254,45 @@ class ModelPredictiveController(object):
         if self.explicit_solution is None:
             raise ValueError('explicit solution not stored.')
 
-        # get feasible set
-        feasible_set = self.mpqp.get_feasible_set()
-
-        # create box containing the feasible set
-        x_max = max([v[0] for v in feasible_set.vertices])
-        x_min = min([v[0] for v in feasible_set.vertices])
-        y_max = max([v[1] for v in feasible_set.vertices])
-        y_min = min([v[1] for v in feasible_set.vertices])
-
-        # create grid
-        x = np.linspace(x_min, x_max, resolution)
-        y = np.linspace(y_min, y_max, resolution)
-        X, Y = np.meshgrid(x, y)
-
-        # evaluate grid
-        zs = np.array([self.explicit_solution.V(np.array([x,y])) for x,y in zip(np.ravel(X), np.ravel(Y))])
-        Z = zs.reshape(X.shape)
+        # get feasible set (computed only once)
+        if self._feasible_set is None:
+            self._feasible_set = self.mpqp.get_feasible_set()
+        feasible_set = self._feasible_set
+
+        # discard the grids if the explicit solution has been replaced
+        if self._value_function_grids_solution is not self.explicit_solution:
+            self._value_function_grids = {}
+            self._value_function_grids_solution = self.explicit_solution
+
+        # evaluate the grid only if not done already for the given resolution
+        if resolution not in self._value_function_grids:
+
+            # create box containing the feasible set
+            vertices = np.vstack(feasible_set.vertices)
+            x_min, y_min = np.min(vertices, axis=0)
+            x_max, y_max = np.max(vertices, axis=0)
+
+            # create grid with resolution proportional to the sides of the box
+            ratio = (y_max - y_min) / (x_max - x_min)
+            min_resolution = max(resolution // 4, 2)
+            x_resolution = resolution if ratio <= 1. else max(int(np.ceil(resolution / ratio)), min_resolution)
+            y_resolution = resolution if ratio >= 1. else max(int(np.ceil(resolution * ratio)), min_resolution)
+            x = np.linspace(x_min, x_max, x_resolution)
+            y = np.linspace(y_min, y_max, y_resolution)
+            X, Y = np.meshgrid(x, y)
+
+            # evaluate grid
+            points = np.column_stack((np.ravel(X), np.ravel(Y)))
+            Z = self.explicit_solution.V_batch(points).reshape(X.shape)
+            self._value_function_grids[resolution] = (X, Y, Z)
+        X, Y, Z = self._value_function_grids[resolution]
 
         # plot
         feasible_set.plot(**kwargs)
-        cp = plt.contour(X, Y, Z)
+        contour_kwargs = {}
+        if tuple(int(v) for v in matplotlib.__version__.split('.')[:2]) >= (3, 6):
+            contour_kwargs['algorithm'] = 'serial' # faster than the default 'mpl2014'
+        cp = plt.contour(X, Y, Z, **contour_kwargs)
         plt.colorbar(cp)
         plt.title(r'$V^*(x)$')
 
@@ -531,6 +531,48 @@ class ExplicitSolution(object):
         # return None if not covered
         return None
 
+    def V_batch(self, X, tol=1.e-7):
+        """
+        Numeric value of the optimal value function at many points at once.
+        Instead of looking for the critical region of each point, it loops over the critical regions and evaluates the value function at all the points they contain.
+
+        Arguments
+        ----------
+        X : numpy.ndarray
+            Points where we want to get the solution, one per row.
+        tol : float
+            Maximum distance of a point from a critical region to be considered inside it.
+
+        Returns
+        ----------
+        numpy.ndarray
+            Optimal value function at the given points (nan if a point is not covered).
+        """
+
+        # initialize all the points as uncovered
+        V = np.full(X.shape[0], np.nan)
+        uncovered = np.ones(X.shape[0], dtype=bool)
+
+        # loop over the critical regions until all the points are covered
+        for cr in self.critical_regions:
+            i_uncovered = np.flatnonzero(uncovered)
+            if i_uncovered.size == 0:
+                break
+
+            # check only the points that have not been assigned yet
+            X_uncovered = X[i_uncovered]
+            in_cr = np.all(X_uncovered.dot(cr.A.T) - cr.b <= tol, axis=1)
+            if cr.polyhedron.C.shape[0] > 0:
+                in_cr &= np.all(np.abs(X_uncovered.dot(cr.polyhedron.C.T) - cr.polyhedron.d) <= tol, axis=1)
+            i_cr = i_uncovered[in_cr]
+            uncovered[i_cr] = False
+
+            # quadratic function of the critical region
+            X_cr = X_uncovered[in_cr]
+            V[i_cr] = .5*np.sum(X_cr.dot(cr._V['xx'])*X_cr, axis=1) + X_cr.dot(cr._V['x']) + cr._V['0']
+
+        return V
+
 class MultiParametricMixedIntegerQuadraticProgram(object):
     """
     Multiparametric Mixed Integer Quadratic Program (mpMIQP) in the form that comes out from the MPC problem for a piecewise affine system, i.e.
@@ -18,38 +18,34 @@ def plot_state_space_trajectory(x, dim=[0,1], text=False, label=None, **kwargs):
     if len(dim) != 2:
         raise ValueError('can plot only 2-dimensional trajectories.')
 
+    # components of the trajectory to be plotted
+    X = np.vstack(x)[:, dim]
+
     # plot trajectory
-    for t in range(len(x)-1):
-        if t == 0:
-            plt.plot(
-                [x[0][dim[0]], x[1][dim[0]]],
-                [x[0][dim[1]], x[1][dim[1]]],
-                label=label,
-                **kwargs
-                )
-        plt.plot(
-            [x[t][dim[0]], x[t+1][dim[0]]],
-            [x[t][dim[1]], x[t+1][dim[1]]],
-            **kwargs
-            )
+    plt.plot(
+        X[:, 0],
+        X[:, 1],
+        label=label,
+        **kwargs
+        )
 
     # plot text
-    for t in range(len(x)):
-        if text:
-            plt.text(x[t][0], x[t][1], r'$x('+str(t)+')$')
+    if text:
+        for t in range(len(x)):
+            plt.text(X[t, 0], X[t, 1], r'$x(%d)$' % t)
 
     # scatter initial condition
     plt.scatter(
-        x[0][dim[0]],
-        x[0][dim[1]],
+        X[0, 0],
+        X[0, 1],
         color='w',
         edgecolor='k',
         zorder=3
         )
 
     # axis labels
-    plt.xlabel(r'$x_{' + str(dim[0]+1) + '}$')
-    plt.ylabel(r'$x_{' + str(dim[1]+1) + '}$')
+    plt.xlabel(r'$x_{%d}$' % (dim[0]+1))
+    plt.ylabel(r'$x_{%d}$' % (dim[1]+1))
 
 def plot_input_sequence(u, h, u_bounds=None):
     """
@@ -70,38 +66,47 @@ def plot_input_sequence(u, h, u_bounds=None):
 
     # time axis
     N = len(u)
-    t = np.linspace(0, N*h, N+1)
+    t = np.arange(N+1)*h
+
+    # stack the input sequence, repeating the first input for the step plot
+    U = np.vstack(u)
+    U = np.vstack((U[:1], U))
+
+    # axis labels
+    ylabels = [r'$u_{%d}$' % (i+1) for i in range(nu)]
 
     # plot each input element separately
+    axes = []
     for i in range(nu):
-        plt.subplot(nu, 1, i+1)
+        ax = plt.subplot(nu, 1, i+1, sharex=axes[0] if axes else None)
+        axes.append(ax)
 
         # plot input sequence
-        u_i_sequence = [u[k][i] for k in range(N)]
-        input_plot, = plt.step(t, [u_i_sequence[0]] + u_i_sequence, 'b')
+        input_plot, = ax.step(t, U[:, i], 'b')
 
         # plot bounds if provided
         if u_bounds is not None:
             for bound in u_bounds:
-                bound_plot, = plt.step(t, bound[i]*np.ones(t.shape), 'r')
-
-        # miscellaneous
-        plt.ylabel(r'$u_{' + str(i+1) + '}$')
-        plt.xlim((0., N*h))
-        if i == 0:
-            if u_bounds is not None:
-                plt.legend(
-                    [input_plot, bound_plot],
-                    ['Optimal control', 'Control bounds'],
-                    loc=1
-                    )
-            else:
-                plt.legend(
-                    [input_plot],
-                    ['Optimal control'],
-                    loc=1
-                    )
-    plt.xlabel(r'$t$')
+                bound_plot = ax.axhline(bound[i], color='r')
+
+        # axis label
+        ax.set_ylabel(ylabels[i])
+
+    # miscellaneous
+    axes[0].set_xlim((0., N*h))
+    axes[-1].set_xlabel(r'$t$')
+    if u_bounds is not None:
+        axes[0].legend(
+            [input_plot, bound_plot],
+            ['Optimal control', 'Control bounds'],
+            loc=1
+            )
+    else:
+        axes[0].legend(
+            [input_plot],
+            ['Optimal control'],
+            loc=1
+            )
 
 def plot_state_trajectory(x, h, x_bounds=None):
     """
@@ -122,38 +127,46 @@ def plot_state_trajectory(x, h, x_bounds=None):
 
     # time axis
     N = len(x) - 1
-    t = np.linspace(0, N*h, N+1)
+    t = np.arange(N+1)*h
+
+    # stack the state trajectory
+    X = np.vstack(x)
+
+    # axis labels
+    ylabels = [r'$x_{%d}$' % (i+1) for i in range(nx)]
 
     # plot each state element separately
+    axes = []
     for i in range(nx):
-        plt.subplot(nx, 1, i+1)
+        ax = plt.subplot(nx, 1, i+1, sharex=axes[0] if axes else None)
+        axes.append(ax)
 
         # plot state trajectory
-        x_i_trajectory = [x[k][i] for k in range(N+1)]
-        state_plot, = plt.plot(t, x_i_trajectory, 'b')
+        state_plot, = ax.plot(t, X[:, i], 'b')
 
         # plot bounds if provided
         if x_bounds is not None:
             for bound in x_bounds:
-                bound_plot, = plt.step(t, bound[i]*np.ones(t.shape),'r')
-
-        # miscellaneous
-        plt.ylabel(r'$x_{' + str(i+1) + '}$')
-        plt.xlim((0., N*h))
-        if i == 0:
-            if x_bounds is not None:
-                plt.legend(
-                    [state_plot, bound_plot],
-                    ['Optimal trajectory', 'State bounds'],
-                    loc=1
-                    )
-            else:
-                plt.legend(
-                    [state_plot],
-                    ['Optimal trajectory'],
-                    loc=1
-                    )
-    plt.xlabel(r'$t$')
+                bound_plot = ax.axhline(bound[i], color='r')
+
+        # axis label
+        ax.set_ylabel(ylabels[i])
+
+    # miscellaneous
+    axes[0].set_xlim((0., N*h))
+    axes[-1].set_xlabel(r'$t$')
+    if x_bounds is not None:
+        axes[0].legend(
+            [state_plot, bound_plot],
+            ['Optimal trajectory', 'State bounds'],
+            loc=1
+            )
+    else:
+        axes[0].legend(
+            [state_plot],
+            ['Optimal trajectory'],
+            loc=1
+            )
 
 def plot_output_trajectory(C, x, h, y_bounds=None):
     """
@@ -172,42 +185,47 @@ def plot_output_trajectory(C, x, h, y_bounds=None):
     """
 
     # apply linear transformation
-    y = [C.dot(x_t) for x_t in x]
+    Y = np.vstack(x).dot(C.T)
 
     # number of plots
     ny = C.shape[0]
 
+    # axis labels
+    ylabels = [r'$y_{%d}$' % (i+1) for i in range(ny)]
+
     # time axis
     N = len(x) - 1
-    t = np.linspace(0, N*h, N+1)
+    t = np.arange(N+1)*h
 
     # plot each state element separately
+    axes = []
     for i in range(ny):
-        plt.subplot(ny, 1, i+1)
+        ax = plt.subplot(ny, 1, i+1, sharex=axes[0] if axes else None)
+        axes.append(ax)
 
         # plot state trajectory
-        y_i_trajectory = [y[k][i] for k in range(N+1)]
-        output_plot, = plt.plot(t, y_i_trajectory, 'b')
+        output_plot, = ax.plot(t, Y[:, i], 'b')
 
         # plot bounds if provided
         if y_bounds is not None:
             for bound in y_bounds:
-                bound_plot, = plt.step(t, bound[i]*np.ones(t.shape),'r')
-
-        # miscellaneous options
-        plt.ylabel(r'$y_{' + str(i+1) + '}$')
-        plt.xlim((0., N*h))
-        if i == 0:
-            if y_bounds is not None:
-                plt.legend(
-                    [output_plot, bound_plot],
-                    ['Optimal trajectory', 'Output bounds'],
-                    loc=1
-                    )
-            else:
-                plt.legend(
-                    [output_plot],
-                    ['Optimal trajectory'],
-                    loc=1
-                    )
-    plt.xlabel(r'$t$')
\ No newline at end of file
+                bound_plot = ax.axhline(bound[i], color='r')
+
+        # axis label
+        ax.set_ylabel(ylabels[i])
+
+    # miscellaneous options
+    axes[0].set_xlim((0., N*h))
+    axes[-1].set_xlabel(r'$t$')
+    if y_bounds is not None:
+        axes[0].legend(
+            [output_plot, bound_plot],
+            ['Optimal trajectory', 'Output bounds'],
+            loc=1
+            )
+    else:
+        axes[0].legend(
+            [output_plot],
+            ['Optimal trajectory'],
+            loc=1
+            )
\ No newline at end of file
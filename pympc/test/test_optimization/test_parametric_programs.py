@@ -70,6 +70,15 @@ class TestMultiParametricQuadraticProgram(unittest.TestCase):
                 self.assertTrue(exp_sol.u(x) is None)
                 self.assertTrue(exp_sol.p(x) is None)
 
+        # batch evaluation of the value function
+        X = np.linspace(-2.5, 2.5, 21).reshape(21, 1)
+        V = exp_sol.V_batch(X)
+        for x, V_x in zip(X, V):
+            if exp_sol.V(x) is not None:
+                self.assertAlmostEqual(V_x, exp_sol.V(x))
+            else:
+                self.assertTrue(np.isnan(V_x))
+
         # feasible set
         fs = mpqp.get_feasible_set()
         A = np.array([[1.],[-1.]])